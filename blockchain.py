@@ -1,25 +1,63 @@
+import hashlib
+import json
+import struct
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# hashlib.sha256 dispatches to OpenSSL, which auto-selects SHA-NI on
+# supporting CPUs; caching the constructor skips the hashlib.new() name
+# lookup on every block.
+_sha256 = hashlib.sha256
+
+# Previous-hash value for the genesis block: an all-zero digest, same
+# width as a real SHA-256 link.
+GENESIS_PREVIOUS_HASH = b'\x00' * 32
+
+def _canonical_data(data):
+    """Serialize block data once into a canonical byte string."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode()
+
 class Block:
-    def __init__(self, index, previous_hash, timestamp, data, hash):
+    def __init__(self, index, previous_hash, timestamp, data, hash, data_canonical):
         self.index = index
         self.previous_hash = previous_hash
         self.timestamp = timestamp
         self.data = data
         self.hash = hash
+        self.data_canonical = data_canonical
+
+    @property
+    def hex(self):
+        """Hex form of the block hash, for display and serialization."""
+        return self.hash.hex()
 
 class Blockchain:
     def __init__(self):
         self.chain = []
-        self.create_block(previous_hash='0')
+        self.create_genesis_block()
+
+    def create_genesis_block(self):
+        return self.create_block(data='Genesis Block')
 
     def create_block(self, data):
         index = len(self.chain) + 1
         timestamp = time.time()
-        previous_hash = self.chain[-1].hash if self.chain else '0'
-        hash = self.hash_block(index, previous_hash, timestamp, data)
-        block = Block(index, previous_hash, timestamp, data, hash)
+        previous_hash = self.chain[-1].hash if self.chain else GENESIS_PREVIOUS_HASH
+        data_canonical = _canonical_data(data)
+        hash = self.hash_block(index, previous_hash, timestamp, data_canonical)
+        block = Block(index, previous_hash, timestamp, data, hash, data_canonical)
         self.chain.append(block)
         return block
 
-    def hash_block(self, index, previous_hash, timestamp, data):
-        # Implement hashing logic here
-        pass
+    def hash_block(self, index, previous_hash, timestamp, data_canonical):
+        # Fixed-layout byte template: the previous hash links in as raw
+        # 32-byte digest, so chaining never round-trips through hex.
+        payload = b"|".join((str(index).encode(), previous_hash,
+                             struct.pack('<d', timestamp), data_canonical))
+        return _sha256(payload).digest()
@@ -1,27 +1,50 @@
 import uuid
+from dataclasses import dataclass, field
 
+@dataclass(frozen=True, slots=True)
 class Identity:
-    def __init__(self, name, id_number, public_key):
-        self.uuid = str(uuid.uuid4())
-        self.name = name
-        self.id_number = id_number
-        self.public_key = public_key
+    name: str
+    id_number: str
+    public_key: str
+    uuid: str = field(default_factory=lambda: uuid.uuid4().hex)
+    _dict: dict = field(init=False, repr=False, compare=False)
 
-    def to_dict(self):
-        return {
+    def __post_init__(self):
+        object.__setattr__(self, '_dict', {
             "uuid": self.uuid,
             "name": self.name,
             "id_number": self.id_number,
             "public_key": self.public_key,
-        }
+        })
+
+    def to_dict(self):
+        # Fields never change after construction, so the dict is built
+        # once in __post_init__; callers must not mutate the returned
+        # dict.
+        return self._dict
 
 def create_identity(name, id_number, public_key):
     return Identity(name, id_number, public_key)
 
-def verify_identity(blockchain, id_number):
-    for block in blockchain.chain:
+def build_identity_index(blockchain):
+    """Return the id_number -> identity data index for a blockchain.
+
+    The index is cached on the blockchain object and extended
+    incrementally, so only blocks appended since the last call are
+    scanned. The first record for an id_number wins, matching the old
+    front-to-back chain walk.
+    """
+    index = getattr(blockchain, '_identity_index', None)
+    if index is None:
+        index = {}
+        blockchain._identity_index = index
+        blockchain._identity_indexed_upto = 0
+    for block in blockchain.chain[blockchain._identity_indexed_upto:]:
         data = block.data
         if isinstance(data, dict) and data.get("type") == "identity":
-            if data.get("id_number") == id_number:
-                return data
-    return None
\ No newline at end of file
+            index.setdefault(data.get("id_number"), data)
+    blockchain._identity_indexed_upto = len(blockchain.chain)
+    return index
+
+def verify_identity(blockchain, id_number):
+    return build_identity_index(blockchain).get(id_number)
\ No newline at end of file
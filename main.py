@@ -1,3 +1,4 @@
+import sys
 import time
 from blockchain import Blockchain
 
@@ -13,12 +14,11 @@ identities = [
 for identity in identities:
     bc.create_block(identity)
 
-# Print the blockchain
-for block in bc.chain:
-    print({
-        "index": block.index,
-        "previous_hash": block.previous_hash,
-        "timestamp": block.timestamp,
-        "data": block.data,
-        "hash": block.hash
-    })
+# Print the blockchain in one write instead of a print() per block
+sys.stdout.write("\n".join(repr({
+    "index": block.index,
+    "previous_hash": block.previous_hash.hex(),
+    "timestamp": block.timestamp,
+    "data": block.data,
+    "hash": block.hex
+}) for block in bc.chain) + "\n")